@@ -1,9 +1,13 @@
 # Clean the test-dats
+
+# Pause between steps for readability, set NAMEIT_TEST_SLEEP=0 to skip it
+TEST_SLEEP=${NAMEIT_TEST_SLEEP:-1}
+
 echo Running "git clean -f test-data"
 
 git clean -f test-data
 
-sleep 1
+sleep $TEST_SLEEP
 
 echo git restore test-data/
 git restore test-data/
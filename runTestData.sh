@@ -1,6 +1,9 @@
 # Run test data
 # Renames the files in the test-data folder using NameIt and tests id they are renamed according the nameIt standard as expexted 
 
+# Pause between steps for readability, set NAMEIT_TEST_SLEEP=0 to run the tests without pauses
+TEST_SLEEP=${NAMEIT_TEST_SLEEP:-1}
+
 echo ""
 echo "checking if test-data files are there"
 echo "" 
@@ -22,13 +25,13 @@ test -f $FILE6             && echo "$FILE6 exists." || { echo  "$FILE6 do not ex
 test -f $FILE7             && echo "$FILE7 exists." || { echo  "$FILE7 do not exist. "; echo  "ABORTING TESTS" ; exit ;  }
 
 
-sleep 1
+sleep $TEST_SLEEP
 
 echo ""
 echo ":) test-data files exist "
 echo ""
 
-sleep 1
+sleep $TEST_SLEEP
 
 echo ""
 echo "renaming now the files"
@@ -62,7 +65,7 @@ echo renaming $FILE1;
 ./NameIt $FILE7
 echo
 
-sleep 1
+sleep $TEST_SLEEP
 
 echo "checking if the filename is now the  expected one"
 